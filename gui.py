@@ -8,73 +8,93 @@
 import os
 import sys
 import json
+import asyncio
+import logging
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
-from typing import Dict, Any, Optional, List
+import queue
+import types
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
 
 # 🔄 メインモジュールをインポート
 try:
-    from main import MemoGenerator
+    from main import (
+        MemoGenerator, PROVIDER_KEY_FIELDS, configure_logging, default_config,
+        _json_loads, _write_json_atomic
+    )
 except ImportError:
     print("❌ main.pyが見つかりません。同じディレクトリに配置してください。")
     sys.exit(1)
 
 
+# 📊 進捗表示の反映間隔（ミリ秒）と1回あたりの最大メッセージ数
+PROGRESS_DRAIN_INTERVAL_MS = 50
+PROGRESS_DRAIN_BATCH = 500
+
+# 🌡️ Temperatureラベル更新の遅延時間（ミリ秒）
+TEMP_LABEL_DEBOUNCE_MS = 50
+
+
 class MemoGeneratorGUI:
     """🖥️ AI Memo Generator GUIクラス"""
     
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, loop: asyncio.AbstractEventLoop):
         """🚀 初期化"""
         self.root = root
+        # バックグラウンドスレッドで動作するasyncioイベントループ
+        self.loop = loop
         self.root.title("🤖 AI Memo Generator")
         self.root.geometry("1000x800")
         
         # 設定の読み込み
         self.config_path = "config.json"
         self.config = self._load_config()
+        # プロバイダー→モデル一覧の読み取り専用ビュー（モデル一覧更新時の参照用）
+        self._providers_map = types.MappingProxyType(self.config.get("providers", {}))
         
-        # MemoGeneratorインスタンス
-        self.generator = MemoGenerator(config_path=self.config_path)
+        # MemoGeneratorインスタンス（読み込み済みの設定を渡して再解析を避ける）
+        self.generator = MemoGenerator(config_path=self.config_path, config=self.config)
         
-        # ファイルリスト
+        # ファイルリスト（表示順のリストと重複チェック用のセット）
         self.input_files = []
+        self._input_files_set: set = set()
+        
+        # 進捗メッセージのキュー（ワーカーから投入し、タイマーでまとめて描画）
+        self._progress_q = queue.SimpleQueue()
         
         # UI構築
         self.build_ui()
+        
+        # 進捗表示の定期反映を開始
+        self.root.after(PROGRESS_DRAIN_INTERVAL_MS, self._drain_progress)
     
     def _load_config(self) -> Dict[str, Any]:
         """📂 設定ファイルの読み込み"""
+        if not os.path.exists(self.config_path):
+            # 初回起動時はデフォルト設定を保存し、次回以降は通常の読み込みで済ませる
+            self.config = self._default_config()
+            self.save_config()
+            return self.config
+        
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # デフォルト設定を返す
-            return {
-                "llm": {
-                    "provider": "openai",
-                    "openai_api_key": "",
-                    "anthropic_api_key": "",
-                    "google_api_key": "",
-                    "model": "gpt-4o-mini",
-                    "temperature": 0.3,
-                    "max_tokens": 1500
-                },
-                "templates": {
-                    "default": "以下は会議の文字起こしです。これを元にAIメモを作成してください。\n\n{transcription}"
-                },
-                "providers": {
-                    "openai": ["gpt-3.5-turbo", "gpt-4o-mini"],
-                    "anthropic": ["claude-3-haiku-20240307"],
-                    "google": ["gemini-pro"]
-                }
-            }
+            return _json_loads(Path(self.config_path).read_bytes())
+        except (OSError, json.JSONDecodeError):
+            # 壊れた設定ファイルは上書きせず、デフォルト設定を返す
+            return self._default_config()
+    
+    @staticmethod
+    def _default_config() -> Dict[str, Any]:
+        """📋 デフォルト設定（テンプレートのみGUI向けの文言）"""
+        config = default_config()
+        config["templates"]["default"] = "以下は会議の文字起こしです。これを元にAIメモを作成してください。\n\n{transcription}"
+        return config
     
     def save_config(self):
         """💾 設定を保存"""
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            _write_json_atomic(self.config_path, self.config)
             return True
         except Exception as e:
             messagebox.showerror("エラー", f"設定ファイルの保存に失敗しました: {e}")
@@ -149,13 +169,7 @@ class MemoGeneratorGUI:
         
         # 現在選択されているプロバイダーのAPIキー状態を表示
         provider = self.config["llm"]["provider"]
-        api_key = ""
-        if provider == "openai":
-            api_key = self.config["llm"].get("openai_api_key", "")
-        elif provider == "anthropic":
-            api_key = self.config["llm"].get("anthropic_api_key", "")
-        elif provider == "google":
-            api_key = self.config["llm"].get("google_api_key", "")
+        api_key = self.config["llm"].get(PROVIDER_KEY_FIELDS.get(provider, ""), "")
         
         masked_key = "設定済み" if api_key else "未設定"
         self.current_api_key_var = tk.StringVar(value=masked_key)
@@ -221,14 +235,27 @@ class MemoGeneratorGUI:
         temp_scale = ttk.Scale(param_frame, from_=0.0, to=1.0, variable=self.temp_var, orient=tk.HORIZONTAL, length=200)
         temp_scale.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
         
-        temp_label = ttk.Label(param_frame, textvariable=self.temp_var, width=5)
-        temp_label.grid(row=0, column=2, padx=5, pady=5)
+        # スライダー操作中の再描画を抑えるため、ラベル更新は遅延させてまとめる
+        self.temp_label = ttk.Label(param_frame, text=f"{self.temp_var.get():.2f}", width=5)
+        self.temp_label.grid(row=0, column=2, padx=5, pady=5)
+        self._temp_after_id = None
+        self.temp_var.trace_add("write", self._on_temp_changed)
         
         ttk.Label(param_frame, text="最大トークン数:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         self.max_tokens_var = tk.IntVar(value=self.config["llm"]["max_tokens"])
         tokens_spinbox = ttk.Spinbox(param_frame, from_=100, to=4000, textvariable=self.max_tokens_var, width=10)
         tokens_spinbox.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
         
+        ttk.Label(param_frame, text="同時実行数:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.max_concurrency_var = tk.IntVar(value=self.config["llm"].get("max_concurrency", 8))
+        concurrency_spinbox = ttk.Spinbox(param_frame, from_=1, to=32, textvariable=self.max_concurrency_var, width=10)
+        concurrency_spinbox.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        ttk.Label(param_frame, text="応答キャッシュ:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.cache_var = tk.BooleanVar(value=self.config["llm"].get("cache", True))
+        cache_check = ttk.Checkbutton(param_frame, text="同じ入力・設定の応答を再利用する（Temperature 0のみ）", variable=self.cache_var)
+        cache_check.grid(row=3, column=1, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        
         # テンプレート設定
         template_frame = ttk.LabelFrame(parent, text="📝 テンプレート設定", padding=10)
         template_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -250,10 +277,21 @@ class MemoGeneratorGUI:
         # 初期化
         self.update_model_list()
     
+    def _on_temp_changed(self, *args):
+        """🌡️ Temperatureラベルの更新を50ms遅延（連続変更時は最後の値のみ描画）"""
+        if self._temp_after_id is not None:
+            self.root.after_cancel(self._temp_after_id)
+        self._temp_after_id = self.root.after(TEMP_LABEL_DEBOUNCE_MS, self._update_temp_label)
+    
+    def _update_temp_label(self):
+        """🌡️ Temperatureラベルを更新"""
+        self._temp_after_id = None
+        self.temp_label.config(text=f"{self.temp_var.get():.2f}")
+    
     def update_model_list(self, event=None):
         """🔄 プロバイダーに基づいてモデルリストを更新"""
         provider = self.provider_var.get()
-        models = self.config.get("providers", {}).get(provider, [])
+        models = self._providers_map.get(provider, ())
         
         self.model_combo["values"] = models
         if models and self.model_var.get() not in models:
@@ -269,6 +307,8 @@ class MemoGeneratorGUI:
         self.config["llm"]["google_api_key"] = self.google_api_key_var.get()
         self.config["llm"]["temperature"] = self.temp_var.get()
         self.config["llm"]["max_tokens"] = self.max_tokens_var.get()
+        self.config["llm"]["max_concurrency"] = max(1, self.max_concurrency_var.get())
+        self.config["llm"]["cache"] = self.cache_var.get()
         
         # テンプレートを更新
         template_text = self.template_text.get(1.0, tk.END).strip()
@@ -283,19 +323,13 @@ class MemoGeneratorGUI:
             
             # 現在選択されているプロバイダーのAPIキー状態を表示
             provider = self.config["llm"]["provider"]
-            api_key = ""
-            if provider == "openai":
-                api_key = self.config["llm"]["openai_api_key"]
-            elif provider == "anthropic":
-                api_key = self.config["llm"]["anthropic_api_key"]
-            elif provider == "google":
-                api_key = self.config["llm"]["google_api_key"]
+            api_key = self.config["llm"].get(PROVIDER_KEY_FIELDS.get(provider, ""), "")
             
             masked_key = "設定済み" if api_key else "未設定"
             self.current_api_key_var.set(masked_key)
             
-            # MemoGeneratorインスタンスを更新
-            self.generator = MemoGenerator(config_path=self.config_path)
+            # MemoGeneratorに設定を反映（再生成せずにその場で更新）
+            self.generator.apply_config(self.config)
             
             messagebox.showinfo("情報", "設定を保存しました")
             
@@ -309,10 +343,16 @@ class MemoGeneratorGUI:
         )
         
         if file_paths:
+            new_paths = []
             for path in file_paths:
-                if path not in self.input_files:
-                    self.input_files.append(path)
-                    self.file_listbox.insert(tk.END, os.path.basename(path))
+                if path not in self._input_files_set:
+                    self._input_files_set.add(path)
+                    new_paths.append(path)
+            
+            # Listboxへの追加は1回の呼び出しにまとめる
+            if new_paths:
+                self.input_files.extend(new_paths)
+                self.file_listbox.insert(tk.END, *map(os.path.basename, new_paths))
     
     def remove_files(self):
         """🗑️ 選択ファイルの削除"""
@@ -322,12 +362,14 @@ class MemoGeneratorGUI:
             
         # 逆順にインデックスを処理（削除時にインデックスがずれるため）
         for i in sorted(selected_indices, reverse=True):
+            self._input_files_set.discard(self.input_files[i])
             del self.input_files[i]
             self.file_listbox.delete(i)
     
     def clear_files(self):
         """🧹 すべてのファイルを削除"""
         self.input_files.clear()
+        self._input_files_set.clear()
         self.file_listbox.delete(0, tk.END)
     
     def browse_output_dir(self):
@@ -343,12 +385,9 @@ class MemoGeneratorGUI:
         self.generator.set_model(self.config["llm"]["model"])
         
         # プロバイダーに対応するAPIキーを設定
-        if provider == "openai":
-            self.generator.set_api_key(self.config["llm"]["openai_api_key"], provider)
-        elif provider == "anthropic":
-            self.generator.set_api_key(self.config["llm"]["anthropic_api_key"], provider)
-        elif provider == "google":
-            self.generator.set_api_key(self.config["llm"]["google_api_key"], provider)
+        key_field = PROVIDER_KEY_FIELDS.get(provider)
+        if key_field:
+            self.generator.set_api_key(self.config["llm"].get(key_field, ""), provider)
         
         self.generator.set_temperature(self.config["llm"]["temperature"])
         self.generator.set_max_tokens(self.config["llm"]["max_tokens"])
@@ -375,83 +414,132 @@ class MemoGeneratorGUI:
         self.generate_button.config(state=tk.DISABLED, text="⏳ 生成中...")
         self.result_text.delete(1.0, tk.END)
         self.result_text.insert(tk.END, f"⏳ AIメモ生成を開始します（{len(self.input_files)}ファイル）\n")
-        self.root.update()
+        # ディスパッチ前に描画だけを反映（イベント処理は行わない）
+        self.root.update_idletasks()
         
-        # 別スレッドで生成処理を実行
-        threading.Thread(target=self._generate_all_in_thread, args=(output_dir,), daemon=True).start()
-    
-    def _generate_all_in_thread(self, output_dir: str):
-        """🧵 別スレッドでの複数ファイル処理"""
-        results = []
+        # 入出力パスの組をディスパッチ前に確定
+        pairs = [(f, self._output_path(f, output_dir)) for f in self.input_files]
         
-        for i, input_file in enumerate(self.input_files):
-            try:
+        # バックグラウンドのイベントループで生成処理を実行
+        future = asyncio.run_coroutine_threadsafe(self._generate_all_async(pairs), self.loop)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_generation_done, f))
+    
+    def _on_generation_done(self, future):
+        """🏁 生成処理完了時のUI更新"""
+        try:
+            results = future.result()
+        except Exception as e:
+            self._append_result(f"⚠️ AIメモ生成エラー: {e}")
+            results = []
+        self._show_final_results(results)
+    
+    @staticmethod
+    def _output_path(input_file: str, output_dir: str) -> str:
+        """📁 入力ファイルに対応する出力ファイルパスを決定"""
+        if output_dir:
+            base_name = os.path.splitext(os.path.basename(input_file))[0]
+            return os.path.join(output_dir, f"{base_name}_memo.txt")
+        base_name = os.path.splitext(input_file)[0]
+        return f"{base_name}_memo.txt"
+    
+    async def _generate_all_async(self, pairs: List[Tuple[str, str]]) -> List[tuple]:
+        """⚡ 全ファイルのAIメモ生成を並行実行"""
+        total = len(pairs)
+        names = [os.path.basename(input_file) for input_file, _ in pairs]
+        # プロバイダーのレート制限を超えないよう同時実行数を制限
+        sem = asyncio.Semaphore(max(1, self.config["llm"].get("max_concurrency", 8)))
+        
+        async def _generate_one(idx: int, input_file: str, output_file: str) -> tuple:
+            async with sem:
                 # 進捗を更新
-                self.root.after(0, lambda idx=i, file=input_file: 
-                               self._update_progress(idx, len(self.input_files), file))
-                
-                # 出力ファイル名の決定
-                if output_dir:
-                    base_name = os.path.splitext(os.path.basename(input_file))[0]
-                    output_file = os.path.join(output_dir, f"{base_name}_memo.txt")
-                else:
-                    base_name = os.path.splitext(input_file)[0]
-                    output_file = f"{base_name}_memo.txt"
+                self._update_progress(idx, total, names[idx])
                 
                 # AIメモ生成
-                result = self.generator.generate_memo_from_file(input_file, output_file)
-                
-                results.append((input_file, output_file, result is not None))
-            except Exception as e:
-                results.append((input_file, None, False))
-                self.root.after(0, lambda msg=f"ファイル処理エラー ({os.path.basename(input_file)}): {e}": 
-                               self._append_result(msg))
+                result = await self.generator.agenerate_memo_from_file(input_file, output_file)
+                return (input_file, output_file, result is not None)
+        
+        outcomes = await asyncio.gather(
+            *(_generate_one(i, f, o) for i, (f, o) in enumerate(pairs)),
+            return_exceptions=True
+        )
         
-        # 処理完了時のUI更新
-        self.root.after(0, lambda: self._show_final_results(results))
+        results = []
+        for (input_file, _), name, outcome in zip(pairs, names, outcomes):
+            if isinstance(outcome, BaseException):
+                results.append((input_file, None, False))
+                self._append_result(f"ファイル処理エラー ({name}): {outcome}")
+            else:
+                results.append(outcome)
+        return results
     
-    def _update_progress(self, current: int, total: int, file: str):
-        """📊 進捗状況の更新"""
-        self.result_text.insert(tk.END, f"📄 処理中: {os.path.basename(file)} ({current+1}/{total})\n")
-        self.result_text.see(tk.END)
-        self.root.update()
+    def _update_progress(self, current: int, total: int, name: str):
+        """📊 進捗状況の更新（どのスレッドからでも呼び出し可能）"""
+        self._progress_q.put(f"📄 処理中: {name} ({current+1}/{total})\n")
     
     def _append_result(self, message: str):
-        """📝 結果のテキストエリアに追加"""
-        self.result_text.insert(tk.END, f"{message}\n")
-        self.result_text.see(tk.END)
-        self.root.update()
+        """📝 結果のテキストエリアに追加（どのスレッドからでも呼び出し可能）"""
+        self._progress_q.put(f"{message}\n")
+    
+    def _flush_progress(self, limit: Optional[int] = None):
+        """🖊️ キューに溜まった進捗メッセージを1回の挿入で描画"""
+        msgs = []
+        while limit is None or len(msgs) < limit:
+            try:
+                msgs.append(self._progress_q.get_nowait())
+            except queue.Empty:
+                break
+        if msgs:
+            self.result_text.insert(tk.END, "".join(msgs))
+            self.result_text.see(tk.END)
+    
+    def _drain_progress(self):
+        """⏱️ 進捗メッセージの定期反映"""
+        self._flush_progress(PROGRESS_DRAIN_BATCH)
+        self.root.after(PROGRESS_DRAIN_INTERVAL_MS, self._drain_progress)
     
     def _show_final_results(self, results: List[tuple]):
         """📊 最終結果の表示"""
+        # 未反映の進捗メッセージを先に描画
+        self._flush_progress()
         self.generate_button.config(state=tk.NORMAL, text="🚀 AIメモ生成")
         
-        success_count = sum(1 for _, _, success in results if success)
-        fail_count = len(results) - success_count
-        
-        self.result_text.insert(tk.END, f"\n{'='*50}\n")
-        self.result_text.insert(tk.END, f"✅ 処理完了: 成功 {success_count} / 失敗 {fail_count} / 合計 {len(results)}\n\n")
-        
-        if success_count > 0:
-            self.result_text.insert(tk.END, "📄 生成されたAIメモ:\n")
-            for input_file, output_file, success in results:
-                if success:
-                    self.result_text.insert(tk.END, f"- {os.path.basename(input_file)} → {output_file}\n")
-        
-        if fail_count > 0:
-            self.result_text.insert(tk.END, "\n❌ 失敗したファイル:\n")
-            for input_file, _, success in results:
-                if not success:
-                    self.result_text.insert(tk.END, f"- {os.path.basename(input_file)}\n")
-        
+        success_lines = [f"- {os.path.basename(i)} → {o}\n" for i, o, ok in results if ok]
+        fail_lines = [f"- {os.path.basename(i)}\n" for i, _, ok in results if not ok]
+        
+        # 集計結果は文字列として組み立ててから1回で挿入
+        parts = [
+            f"\n{'='*50}\n",
+            f"✅ 処理完了: 成功 {len(success_lines)} / 失敗 {len(fail_lines)} / 合計 {len(results)}\n\n"
+        ]
+        if success_lines:
+            parts.append("📄 生成されたAIメモ:\n")
+            parts.extend(success_lines)
+        if fail_lines:
+            parts.append("\n❌ 失敗したファイル:\n")
+            parts.extend(fail_lines)
+        
+        self.result_text.insert(tk.END, "".join(parts))
         self.result_text.see(tk.END)
 
 
 def main():
     """🚀 メインエントリーポイント"""
+    configure_logging()
+    
+    # asyncioイベントループは別スレッドで常駐させ、Tkのmainloopはメインスレッドで実行
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    
     root = tk.Tk()
-    app = MemoGeneratorGUI(root)
+    app = MemoGeneratorGUI(root, loop)
     root.mainloop()
+    
+    app.generator.close()
+    loop.call_soon_threadsafe(loop.stop)
+    
+    # 実行中のAPI呼び出しは中断できないため、完了を待たずに終了する（ウィンドウを閉じた時点で結果は破棄）
+    logging.shutdown()
+    os._exit(0)
 
 
 if __name__ == "__main__":
@@ -6,88 +6,792 @@
 """
 
 import os
+import re
 import sys
+import io
+import queue
 import json
+import time
 import logging
 import argparse
-from datetime import datetime
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple, Callable, TYPE_CHECKING
 
-# 📚 サードパーティライブラリのインポート
-import requests
+# ⚡ 高速JSONライブラリ（インストールされていれば使用）
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# 📝 ロガーの設定
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+if TYPE_CHECKING:
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+
+# 🔑 プロバイダーごとのAPIキー設定項目
+PROVIDER_KEY_FIELDS = {
+    "openai": "openai_api_key",
+    "anthropic": "anthropic_api_key",
+    "google": "google_api_key"
+}
+
+# 📝 ロガー（出力設定はエントリーポイントで行う）
 logger = logging.getLogger("ai_memo_generator")
 
 
+def configure_logging():
+    """📝 ログ出力の設定"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+
+def gil_enabled() -> bool:
+    """🔒 GILが有効かどうか（Python 3.13未満では常にTrue）
+    
+    フリースレッド版（python3.13t）ではGILが無効になり、スレッドプール上の
+    API呼び出しと応答のJSON解析がCPUコア数に応じて並列に実行される。
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """📦 JSONをUTF-8のバイト列にシリアライズ（orjsonがあれば使用）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """📦 JSONのバイト列を解析（orjsonがあれば使用）"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json_atomic(path: str, obj: Any):
+    """💾 JSONを一時ファイルに書き込んでから置き換え（書き込み途中のファイルを残さない）"""
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_bytes(_json_dumps(obj, indent=True))
+    os.replace(tmp_path, path)
+
+
+_SSE_EVENT_END = re.compile(rb"\r?\n\r?\n")
+
+
+def _sse_event_payload(event: bytes) -> Optional[bytes]:
+    """🌊 SSEイベント1件からdataフィールドを取り出す（複数行は改行で連結）"""
+    data = [line[5:].strip() for line in event.splitlines() if line.startswith(b"data:")]
+    if not data:
+        return None
+    return b"\n".join(data)
+
+
+def _iter_sse_data(response) -> Iterator[Dict[str, Any]]:
+    """🌊 SSE（Server-Sent Events）応答のdataフィールドをJSONとして順次返す
+
+    行単位ではなく8KB単位で受信バッファに溜め、イベント区切り（空行）ごとにまとめて解析する
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        buf.extend(chunk)
+        start = 0
+        while True:
+            match = _SSE_EVENT_END.search(buf, start)
+            if match is None:
+                break
+            payload = _sse_event_payload(bytes(buf[start:match.start()]))
+            start = match.end()
+            if payload is None:
+                continue
+            if payload == b"[DONE]":
+                return
+            yield _json_loads(payload)
+        del buf[:start]
+
+    # 📦 区切りなしで終わった末尾イベントを処理
+    payload = _sse_event_payload(bytes(buf))
+    if payload is not None and payload != b"[DONE]":
+        yield _json_loads(payload)
+
+
+def _collect_stream(deltas: Iterable[Optional[str]], sink: Callable[[str], None]) -> Optional[str]:
+    """🌊 受信した差分テキストを逐次sinkへ渡し、全文を返す"""
+    buf = io.StringIO()
+    for delta in deltas:
+        if delta:
+            sink(delta)
+            buf.write(delta)
+    return buf.getvalue() or None
+
+
+def _google_text(result: Dict[str, Any]) -> Optional[str]:
+    """🔎 Gemini応答の先頭候補のテキストを連結して返す（想定外の形式ならNone）"""
+    try:
+        parts = result["candidates"][0]["content"]["parts"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return "".join(part["text"] for part in parts if "text" in part)
+
+
+class StreamError(Exception):
+    """🌊 ストリーミング応答がエラーイベント、または終了イベントなしで途切れた場合の例外"""
+
+
+def _openai_stream_deltas(response) -> Iterator[Optional[str]]:
+    """🌊 OpenAIのストリーミング応答から差分テキストを返す（finish_reasonなしで終わればStreamError）"""
+    finished = False
+    for event in _iter_sse_data(response):
+        if "error" in event:
+            raise StreamError(f"OpenAIのストリーミング応答でエラーが発生しました: {event['error']}")
+        choices = event.get("choices")
+        if not choices:
+            continue
+        yield choices[0]["delta"].get("content")
+        if choices[0].get("finish_reason"):
+            finished = True
+    if not finished:
+        raise StreamError("OpenAIのストリーミング応答が完了前に途切れました")
+
+
+def _anthropic_stream_deltas(response) -> Iterator[Optional[str]]:
+    """🌊 Anthropicのストリーミング応答から差分テキストを返す（message_stopなしで終わればStreamError）"""
+    finished = False
+    for event in _iter_sse_data(response):
+        event_type = event.get("type")
+        # content_block_deltaイベントにテキストの差分が含まれる
+        if event_type == "content_block_delta":
+            yield event["delta"].get("text")
+        elif event_type == "message_stop":
+            finished = True
+        elif event_type == "error":
+            raise StreamError(f"Anthropicのストリーミング応答でエラーが発生しました: {event.get('error')}")
+    if not finished:
+        raise StreamError("Anthropicのストリーミング応答が完了前に途切れました")
+
+
+def _google_stream_deltas(response) -> Iterator[Optional[str]]:
+    """🌊 Geminiのストリーミング応答から差分テキストを返す（finishReasonなしで終わればStreamError）"""
+    finished = False
+    for event in _iter_sse_data(response):
+        if "error" in event:
+            raise StreamError(f"Google APIのストリーミング応答でエラーが発生しました: {event['error']}")
+        yield _google_text(event)
+        candidates = event.get("candidates")
+        if candidates and candidates[0].get("finishReason"):
+            finished = True
+    if not finished:
+        raise StreamError("Google APIのストリーミング応答が完了前に途切れました")
+
+
+def _stdout_sink(delta: str):
+    """🖥️ 差分テキストを標準出力へ即時表示"""
+    sys.stdout.write(delta)
+    sys.stdout.flush()
+
+
+# ✂️ 長い文字起こしの分割位置（段落・日本語の句点・英文のピリオドの直後）
+_SPLIT_PATTERN = re.compile(r"(?<=\n\n)|(?<=。)|(?<=\. )")
+
+# 📝 分割して作成した部分議事録を統合するためのデフォルトテンプレート
+DEFAULT_MERGE_TEMPLATE = (
+    "以下は長い会議の文字起こしを分割し、部分ごとに作成した議事録です。"
+    "重複を整理し、全体として1つの簡潔で構造化された議事録に統合してください。\n\n"
+    "フォーマットは以下の通りにしてください：\n"
+    "1. 会議の概要\n2. 主な議題と議論\n3. 決定事項\n4. アクションアイテム（担当者と期限）\n\n"
+    "部分議事録：\n{transcription}"
+)
+
+
+def _split_transcript(text: str, max_chars: int = 8000) -> List[str]:
+    """✂️ 文字起こしを段落・文の区切りで最大max_chars文字ずつのチャンクに分割"""
+    chunks = []
+    current = []
+    size = 0
+    for segment in _SPLIT_PATTERN.split(text):
+        # 区切りがなく長すぎる部分は文字数で強制的に分割
+        for i in range(0, len(segment), max_chars):
+            piece = segment[i:i + max_chars]
+            if current and size + len(piece) > max_chars:
+                chunks.append("".join(current))
+                current = []
+                size = 0
+            current.append(piece)
+            size += len(piece)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+# 🗣️ 文の区切り（句点・全角の疑問符/感嘆符・改行、半角の.?!は直後が空白の場合のみ）
+# 「3.5」などの小数や「1. 会議の概要」などの番号付きリストでは区切らない
+_SENTENCE_END = re.compile(r"[。？！]+|\n|(?<!\d)[.?!]+(?=\s)")
+
+
+def _iter_sentences(deltas: Iterable[str], max_chars: int = 240) -> Iterator[str]:
+    """🗣️ 差分テキストを文の区切りごと（区切りがなければ最大文字数ごと）にまとめて返す"""
+    buffer = ""
+    for delta in deltas:
+        buffer += delta
+        start = 0
+        for match in _SENTENCE_END.finditer(buffer):
+            sentence = buffer[start:match.end()].strip()
+            if sentence:
+                yield sentence
+            start = match.end()
+        buffer = buffer[start:]
+        if len(buffer) > max_chars:
+            sentence = buffer.strip()
+            if sentence:
+                yield sentence
+            buffer = ""
+    sentence = buffer.strip()
+    if sentence:
+        yield sentence
+
+
+def _read_text(path: str) -> str:
+    """📖 テキストファイルを読み込む（バイト列で一括読み込みしてから1回でデコード）"""
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    # テキストモードと同様に改行をLFへ統一（段落区切りの検出にCRLFを残さない）
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _write_text(path: str, text: str):
+    """✏️ テキストファイルに書き込む"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _default_output_path(input_file: str) -> str:
+    """📁 デフォルトの出力ファイルパス（input_memo.txt）"""
+    return f"{os.path.splitext(input_file)[0]}_memo.txt"
+
+
+def default_config() -> Dict[str, Any]:
+    """📋 デフォルト設定（設定ファイルが読み込めない場合に使用）"""
+    return {
+        "llm": {
+            "provider": "openai",
+            "openai_api_key": "",
+            "anthropic_api_key": "",
+            "google_api_key": "",
+            "model": "gpt-4o-mini",
+            "temperature": 0.3,
+            "max_tokens": 1500,
+            "max_concurrency": 8,
+            "cache": True,
+            "cache_ttl": 604800,
+            "chunk_chars": 8000,
+            "rpm": 60
+        },
+        "templates": {
+            "default": "以下は会議の文字起こしです。これを元に議事録を作成してください。\n\n{transcription}"
+        },
+        "providers": {
+            "openai": ["gpt-3.5-turbo", "gpt-4o-mini"],
+            "anthropic": ["claude-3-haiku-20240307"],
+            "google": ["gemini-pro"]
+        }
+    }
+
+
+class LLMCache:
+    """💾 LLM応答のキャッシュ（メモリ上のLRU + ディスク、入力と設定のハッシュをキーとする）
+    
+    保存からttl秒を過ぎた応答は使用せず、ディスク上の期限切れファイルも削除する。
+    """
+    
+    def __init__(self, cache_dir: str, ttl: float = 7 * 24 * 60 * 60, max_memory_entries: int = 100):
+        """🚀 初期化"""
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pruned = False
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """🔑 キャッシュキーを生成"""
+        import hashlib
+        
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _expired(self, stored_at: float) -> bool:
+        return time.time() - stored_at > self.ttl
+    
+    def _remember(self, key: str, value: str, stored_at: float):
+        """🧠 メモリキャッシュに登録（上限を超えたら最も古いものを破棄）"""
+        with self._lock:
+            self._memory[key] = (value, stored_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def get(self, key: str) -> Optional[str]:
+        """📂 キャッシュされた応答を取得（なければ、または期限切れならNone）"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._memory[key]
+        
+        path = self._path(key)
+        value = None
+        try:
+            stored_at = os.path.getmtime(path)
+            if self._expired(stored_at):
+                os.remove(path)
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    value = json.load(f)["response"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ キャッシュの読み込みに失敗しました: {e}")
+        
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        self._remember(key, value, stored_at)
+        with self._lock:
+            self.hits += 1
+        return value
+    
+    def set(self, key: str, value: str):
+        """💾 応答をキャッシュに保存"""
+        self._remember(key, value, time.time())
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._path(key)}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"response": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"⚠️ キャッシュの保存に失敗しました: {e}")
+        
+        # 最初の保存時に期限切れのファイルを掃除（ディスク上のキャッシュが増え続けないようにする）
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+    
+    def prune(self):
+        """🧹 期限切れのキャッシュファイルを削除"""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and self._expired(entry.stat().st_mtime):
+                        os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"⚠️ 期限切れキャッシュの削除に失敗しました: {e}")
+
+
+class TokenBucket:
+    """🪣 トークンバケット方式のレート制限（スレッドセーフ、残量は取得時に補充）"""
+    
+    def __init__(self, rate: float, capacity: float):
+        """🚀 初期化（rateは1秒あたりの補充量、capacityはバースト上限）"""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1):
+        """⏳ トークンを消費し、不足していれば補充されるまで待機"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 先に予約してから待つことで、待機中の他スレッドと順番が入れ替わらない
+            self._tokens -= cost
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            logger.debug(f"🪣 レート制限のため{wait:.2f}秒待機します")
+            time.sleep(wait)
+
+
 class MemoGenerator:
     """🔄 文字起こしテキストから議事録を生成するクラス"""
     
-    def __init__(self, config_path: str = "config.json"):
-        """🚀 初期化"""
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "config.json", config: Optional[Dict[str, Any]] = None):
+        """🚀 初期化（解析済みの設定が渡された場合は再読み込みしない）"""
+        self.config = config if config is not None else self._load_config(config_path)
         self.config_path = config_path
+        # HTTPセッションを使い回し、keep-aliveでTLSハンドシェイクを省略する
+        self._session = self._create_session()
+        # 同期APIを並行実行するためのスレッドプール
+        self._pool = self._create_pool()
+        # close()後は新しいAPI呼び出しを行わない
+        self._closed = False
+        # LLM応答キャッシュ
+        self._cache = self._create_cache()
+        # API呼び出しのレート制限
+        self._bucket = self._create_bucket()
+        # ファイル・チャンクをまたいだAPI呼び出しの同時実行数の上限
+        self._api_slots = self._create_api_slots()
+        # プレースホルダーで分割済みのテンプレート
+        self._prepare_template()
+        # プロバイダーごとのモデル一覧（集合）
+        self._prepare_provider_models()
+        # 現在のプロバイダーの接続先情報
+        self._prepare_provider()
+        # プロバイダー名からAPI呼び出しメソッドへの対応表
+        self._dispatch = {
+            "openai": self._call_openai_api,
+            "anthropic": self._call_anthropic_api,
+            "google": self._call_google_api
+        }
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """📂 設定ファイルの読み込み"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_loads(Path(config_path).read_bytes())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"⚠️ 設定ファイルの読み込みエラー: {e}")
             # 最小限のデフォルト設定を返す
-            return {
-                "llm": {
-                    "provider": "openai",
-                    "openai_api_key": "",
-                    "anthropic_api_key": "",
-                    "google_api_key": "",
-                    "model": "gpt-4o-mini",
-                    "temperature": 0.3,
-                    "max_tokens": 1500
-                },
-                "templates": {
-                    "default": "以下は会議の文字起こしです。これを元に議事録を作成してください。\n\n{transcription}"
-                },
-                "providers": {
-                    "openai": ["gpt-3.5-turbo", "gpt-4o-mini"],
-                    "anthropic": ["claude-3-haiku-20240307"],
-                    "google": ["gemini-pro"]
-                }
-            }
+            return default_config()
     
     def save_config(self):
         """💾 設定を保存"""
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            _write_json_atomic(self.config_path, self.config)
             logger.info(f"✅ 設定を保存しました: {self.config_path}")
         except Exception as e:
             logger.error(f"⚠️ 設定の保存に失敗しました: {e}")
     
-    def generate_memo_from_file(self, input_file: str, output_file: Optional[str] = None) -> Optional[str]:
-        """📄 ファイルから文字起こしを読み込み、議事録を生成"""
+    def _create_session(self) -> "requests.Session":
+        """🌐 接続プールと再試行ポリシーを設定したHTTPセッションを作成"""
+        # 📚 requestsは読み込みが重いため、実際にセッションを作るときに読み込む
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # レート制限(429)と一時的なサーバーエラーは指数バックオフで再試行
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"GET", "POST"},
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry))
+        return session
+    
+    def _create_pool(self) -> "ThreadPoolExecutor":
+        """🧵 同時実行数に合わせたスレッドプールを作成"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self._pool_size = max(1, self.config["llm"].get("max_concurrency", 8))
+        if not gil_enabled():
+            logger.info(f"🧵 フリースレッドモード: {self._pool_size}スレッドで並列実行します")
+        return ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="memo")
+    
+    def _prepare_template(self):
+        """📝 テンプレートを{transcription}の前後に分割して保持（呼び出し時は連結のみ）"""
+        self._tmpl_parts = tuple(self.config["templates"]["default"].split("{transcription}"))
+    
+    def _prepare_provider_models(self):
+        """📋 プロバイダーごとのモデル一覧をfrozensetに変換して保持（所属判定をO(1)にする）"""
+        self._provider_models = {
+            provider: frozenset(models)
+            for provider, models in self.config.get("providers", {}).items()
+        }
+    
+    def _prepare_provider(self):
+        """🌐 現在のプロバイダーのURL・ヘッダー・リクエストボディの固定部分を事前に構築"""
+        llm = self.config["llm"]
+        provider = llm["provider"]
+        model = llm["model"]
+        api_key = llm.get(PROVIDER_KEY_FIELDS.get(provider, ""), "")
+        
+        if provider == "openai":
+            url = stream_url = "https://api.openai.com/v1/chat/completions"
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}"
+            }
+            body_template = {"model": model}
+        elif provider == "anthropic":
+            # Claude Messages API形式で呼び出し
+            url = stream_url = "https://api.anthropic.com/v1/messages"
+            headers = {
+                "Content-Type": "application/json",
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01"
+            }
+            body_template = {"model": model}
+        elif provider == "google":
+            # モデル名に基づいてAPIパスを構築
+            model_id = model.replace("gemini-", "")
+            base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}"
+            url = f"{base_url}:generateContent?key={api_key}"
+            stream_url = f"{base_url}:streamGenerateContent?alt=sse&key={api_key}"
+            headers = {
+                "Content-Type": "application/json"
+            }
+            body_template = {"generationConfig": {"topP": 0.95, "topK": 40}}
+        else:
+            url = stream_url = ""
+            headers = {}
+            body_template = {}
+        
+        # 呼び出し中のスレッドから一貫した組み合わせが見えるよう、まとめて差し替える
+        self._endpoint = (url, stream_url, headers, body_template)
+    
+    def _create_cache(self) -> Optional[LLMCache]:
+        """💾 設定に応じて応答キャッシュを作成（無効ならNone）"""
+        llm = self.config["llm"]
+        if not llm.get("cache", True):
+            return None
+        return LLMCache(llm.get("cache_dir", "~/.cache/aimemo"), llm.get("cache_ttl", 7 * 24 * 60 * 60))
+    
+    def _create_bucket(self) -> TokenBucket:
+        """🪣 設定の1分あたりリクエスト数(rpm)からレート制限を作成（バーストは同時実行数まで）"""
+        llm = self.config["llm"]
+        rpm = max(1, llm.get("rpm", 60))
+        return TokenBucket(rpm / 60, max(1, llm.get("max_concurrency", 8)))
+    
+    def _create_api_slots(self) -> threading.BoundedSemaphore:
+        """🚦 API呼び出しの同時実行数を制限するセマフォを作成（分割処理のチャンクも含めて同時実行数まで）"""
+        return threading.BoundedSemaphore(max(1, self.config["llm"].get("max_concurrency", 8)))
+    
+    def apply_config(self, config: Dict[str, Any]):
+        """🔄 新しい設定をこのインスタンスに反映（インスタンスは再生成しない）"""
+        self.config = config
+        self._cache = self._create_cache()
+        self._bucket = self._create_bucket()
+        self._api_slots = self._create_api_slots()
+        self._prepare_template()
+        self._prepare_provider_models()
+        self._prepare_provider()
+        # 同時実行数が変わった場合のみスレッドプールを作り直す
+        if self._pool_size != max(1, config["llm"].get("max_concurrency", 8)):
+            old_pool = self._pool
+            self._pool = self._create_pool()
+            old_pool.shutdown(wait=False)
+    
+    def close(self):
+        """🛑 スレッドプールを停止（待機中の処理は取り消し、以降のAPI呼び出しは行わない）"""
+        self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def agenerate_memo(self, transcription: str) -> Optional[str]:
+        """⚡ generate_memoの非同期版（スレッドプールで実行）"""
+        # 📚 asyncioは読み込みが重いため、非同期処理を使うときに読み込む（--help等の起動を軽くする）
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self.generate_memo, transcription)
+    
+    async def agenerate_memo_from_file(self, input_file: str, output_file: Optional[str] = None) -> Optional[str]:
+        """⚡ generate_memo_from_fileの非同期版（ファイルI/OとAPI呼び出しを個別に待機）"""
+        import asyncio
+        
+        try:
+            # 入力ファイル読み込み（ディスクI/Oは既定のエグゼキューターで実行）
+            transcription = await asyncio.to_thread(_read_text, input_file)
+            
+            # 出力ファイル名が指定されていない場合
+            if output_file is None:
+                output_file = _default_output_path(input_file)
+            
+            # 議事録生成（API呼び出しはスレッドプールで実行）
+            memo = await self.agenerate_memo(transcription)
+            
+            if memo:
+                # 生成結果の保存
+                await asyncio.to_thread(_write_text, output_file, memo)
+                logger.info(f"✅ 議事録を保存しました: {output_file}")
+                return memo
+            
+            return None
+        
+        except FileNotFoundError:
+            logger.error(f"❌ ファイルが見つかりません: {input_file}")
+            return None
+        except Exception as e:
+            logger.error(f"⚠️ 議事録生成エラー: {e}")
+            return None
+    
+    async def agenerate_memos_from_files(self, input_files: List[str]) -> List[Optional[str]]:
+        """⚡ 複数ファイルの議事録を同時実行数を制限しながら並行生成"""
+        import asyncio
+        
+        sem = asyncio.Semaphore(max(1, self.config["llm"].get("max_concurrency", 8)))
+        
+        async def _bounded(input_file: str) -> Optional[str]:
+            async with sem:
+                return await self.agenerate_memo_from_file(input_file)
+        
+        return await asyncio.gather(*(_bounded(f) for f in input_files))
+    
+    def generate_memos_from_files(self, input_files: List[str]) -> List[Optional[str]]:
+        """📚 複数ファイルの議事録を並行生成（同期呼び出し用）"""
+        import asyncio
+        
+        return asyncio.run(self.agenerate_memos_from_files(input_files))
+    
+    def generate_memos_batch(self, input_files: List[str], poll_interval: float = 30.0) -> List[Optional[str]]:
+        """📦 OpenAI Batch APIで複数ファイルの議事録をまとめて生成（低コスト・非リアルタイム）"""
+        results: List[Optional[str]] = [None] * len(input_files)
+        
+        provider = self.config["llm"]["provider"]
+        if provider != "openai":
+            logger.error(f"❌ バッチモードはOpenAIのみ対応しています: {provider}")
+            return results
+        
+        api_key = self.config["llm"].get("openai_api_key", "")
+        if not api_key:
+            logger.error("🔑 OpenAI APIキーが設定されていません。")
+            return results
+        
+        headers = {"Authorization": f"Bearer {api_key}"}
+        base_url = "https://api.openai.com/v1"
+        batch_id = None
+        
+        try:
+            # リクエストをJSONL形式にまとめる（custom_idは入力の順番）
+            lines = []
+            for i, input_file in enumerate(input_files):
+                prompt = _read_text(input_file).join(self._tmpl_parts)
+                lines.append(_json_dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._openai_body(prompt)
+                }))
+            
+            # 入力ファイルのアップロード
+            response = self._session.post(
+                f"{base_url}/files",
+                headers=headers,
+                data={"purpose": "batch"},
+                files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")}
+            )
+            if response.status_code != 200:
+                logger.error(f"❌ バッチ入力のアップロードエラー: {response.status_code} - {response.text}")
+                return results
+            input_file_id = _json_loads(response.content)["id"]
+            
+            # バッチの作成
+            response = self._session.post(
+                f"{base_url}/batches",
+                headers={**headers, "Content-Type": "application/json"},
+                data=_json_dumps({
+                    "input_file_id": input_file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h"
+                })
+            )
+            if response.status_code != 200:
+                logger.error(f"❌ バッチ作成エラー: {response.status_code} - {response.text}")
+                return results
+            batch = _json_loads(response.content)
+            batch_id = batch["id"]
+            logger.info(f"📦 バッチを作成しました: {batch_id}（{len(input_files)}件）")
+            
+            # 完了までポーリング（一時的なエラーでは中断せず、次回のポーリングで再試行）
+            while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                try:
+                    response = self._session.get(f"{base_url}/batches/{batch_id}", headers=headers)
+                except OSError as e:
+                    logger.warning(f"⚠️ バッチ状態の取得に失敗しました（再試行します）: {batch_id} - {e}")
+                    continue
+                if response.status_code == 429 or response.status_code >= 500:
+                    logger.warning(f"⚠️ バッチ状態の取得に失敗しました（再試行します）: {batch_id} - {response.status_code}")
+                    continue
+                if response.status_code != 200:
+                    logger.error(f"❌ バッチ状態の取得エラー ({batch_id}): {response.status_code} - {response.text}")
+                    return results
+                batch = _json_loads(response.content)
+                logger.info(f"⏳ バッチ状態: {batch['status']}")
+            
+            if batch["status"] != "completed" or not batch.get("output_file_id"):
+                logger.error(f"❌ バッチ処理が完了しませんでした ({batch_id}): {batch['status']}")
+                return results
+            
+            # 結果のダウンロードと保存
+            response = self._session.get(f"{base_url}/files/{batch['output_file_id']}/content", headers=headers)
+            if response.status_code != 200:
+                logger.error(f"❌ バッチ結果の取得エラー ({batch_id}): {response.status_code} - {response.text}")
+                return results
+            
+            for line in response.content.splitlines():
+                if not line.strip():
+                    continue
+                item = _json_loads(line)
+                i = int(item["custom_id"])
+                body = (item.get("response") or {}).get("body") or {}
+                if item.get("error") or not body.get("choices"):
+                    logger.error(f"❌ バッチ内のリクエストが失敗しました ({input_files[i]}): {item.get('error') or body}")
+                    continue
+                
+                memo = body["choices"][0]["message"]["content"]
+                output_file = _default_output_path(input_files[i])
+                _write_text(output_file, memo)
+                logger.info(f"✅ 議事録を保存しました: {output_file}")
+                results[i] = memo
+        
+        except Exception as e:
+            # バッチ作成後の失敗では、IDを手がかりに結果を手動で回収できるようにする
+            suffix = f"（バッチID: {batch_id}）" if batch_id else ""
+            logger.error(f"⚠️ バッチ処理例外: {e}{suffix}")
+        
+        return results
+    
+    def generate_memo_from_file(self, input_file: str, output_file: Optional[str] = None,
+                                stream: bool = False) -> Optional[str]:
+        """📄 ファイルから文字起こしを読み込み、議事録を生成（stream=Trueで受信しながら出力ファイルへ書き込み）"""
         try:
             # 入力ファイル読み込み
-            with open(input_file, "r", encoding="utf-8") as f:
-                transcription = f.read()
+            transcription = _read_text(input_file)
             
             # 出力ファイル名が指定されていない場合
             if output_file is None:
-                base_name = os.path.splitext(input_file)[0]
-                output_file = f"{base_name}_memo.txt"
+                output_file = _default_output_path(input_file)
             
             # 議事録生成
-            memo = self.generate_memo(transcription)
+            if stream:
+                # 受信した差分を一時ファイルへ書き込み、標準出力にも表示
+                # （成功した場合のみ置き換え、失敗しても既存の出力ファイルは残す）
+                tmp_path = f"{output_file}.tmp"
+                memo = None
+                try:
+                    with open(tmp_path, "w", encoding="utf-8") as out_f:
+                        def sink(delta: str):
+                            out_f.write(delta)
+                            _stdout_sink(delta)
+                        memo = self.generate_memo(transcription, sink=sink)
+                    if memo:
+                        os.replace(tmp_path, output_file)
+                finally:
+                    if not memo and os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+            else:
+                memo = self.generate_memo(transcription)
+                if memo:
+                    # 生成結果の保存
+                    _write_text(output_file, memo)
             
             if memo:
-                # 生成結果の保存
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(memo)
                 logger.info(f"✅ 議事録を保存しました: {output_file}")
                 return memo
             
@@ -100,65 +804,159 @@ class MemoGenerator:
             logger.error(f"⚠️ 議事録生成エラー: {e}")
             return None
     
-    def generate_memo(self, transcription: str) -> Optional[str]:
-        """🧠 文字起こしテキストから議事録を生成"""
-        # テンプレートを取得
-        template = self.config["templates"]["default"]
-        prompt = template.replace("{transcription}", transcription)
+    def generate_memo(self, transcription: str, stream: bool = False,
+                      sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """🧠 文字起こしテキストから議事録を生成
+        
+        sinkを指定すると応答をストリーミングで受信し、差分テキストを順次sinkへ渡す。
+        stream=Trueでsinkを省略した場合は標準出力へ表示する。
+        """
+        if stream and sink is None:
+            sink = _stdout_sink
+
+        # テンプレートに文字起こしを埋め込み（分割済みテンプレートを連結）
+        prompt = transcription.join(self._tmpl_parts)
         
         # LLM API呼び出し
         provider = self.config["llm"]["provider"]
+        
+        # 同じ入力・設定の応答がキャッシュにあれば再利用
+        # （temperature=0の決定的な呼び出しのみ。サンプリングした応答を固定しない）
+        llm = self.config["llm"]
+        cache_key = None
+        if self._cache is not None and llm["temperature"] == 0:
+            cache_key = LLMCache.make_key(
+                provider=provider,
+                model=llm["model"],
+                temperature=llm["temperature"],
+                max_tokens=llm["max_tokens"],
+                prompt=prompt
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"💾 キャッシュから応答を取得しました ({provider}): 約{len(cached)}文字")
+                if sink is not None:
+                    sink(cached)
+                return cached
+        
         logger.info(f"🔄 LLM API ({provider}) 呼び出し開始")
         
-        result = None
-        if provider == "openai":
-            result = self._call_openai_api(prompt)
-        elif provider == "anthropic":
-            result = self._call_anthropic_api(prompt)
-        elif provider == "google":
-            result = self._call_google_api(prompt)
+        # 長い文字起こしは分割して並行処理し、最後に統合する
+        chunk_chars = self.config["llm"].get("chunk_chars", 8000)
+        if chunk_chars and len(transcription) > chunk_chars:
+            chunks = _split_transcript(transcription, chunk_chars)
+            logger.info(f"✂️ 文字起こしを{len(chunks)}個に分割して処理します")
+            result = self._map_reduce(chunks, sink)
         else:
-            logger.error(f"❌ サポートされていないプロバイダー: {provider}")
-            return None
+            result = self._call_api(prompt, sink)
         
         if result:
             logger.info(f"✅ LLM API ({provider}) 呼び出し完了: 約{len(result)}文字の応答を受信")
+            if cache_key is not None:
+                self._cache.set(cache_key, result)
         else:
             logger.error(f"❌ LLM API ({provider}) 呼び出し失敗: 応答なし")
         
         return result
     
-    def _call_openai_api(self, prompt: str) -> Optional[str]:
+    def iter_memo(self, transcription: str, outcome: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """🌊 議事録をストリーミング生成し、受信した差分テキストを順次返す
+        
+        outcomeを渡すと、終了後にgenerate_memoの戻り値（失敗時はNone）を"memo"に格納する。
+        途中で失敗しても受信済みの差分は返されるため、成否はこの値で判定する。
+        """
+        deltas = queue.SimpleQueue()
+        done = object()
+        if outcome is None:
+            outcome = {}
+        outcome["memo"] = None
+        
+        def _run():
+            try:
+                outcome["memo"] = self.generate_memo(transcription, sink=deltas.put)
+            except Exception as e:
+                logger.error(f"⚠️ 議事録生成エラー: {e}")
+            finally:
+                deltas.put(done)
+        
+        threading.Thread(target=_run, daemon=True).start()
+        while True:
+            delta = deltas.get()
+            if delta is done:
+                return
+            yield delta
+    
+    def _call_api(self, prompt: str, sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """🔀 現在のプロバイダーのAPIを呼び出す"""
+        if self._closed:
+            return None
+        provider = self.config["llm"]["provider"]
+        handler = self._dispatch.get(provider)
+        if handler is None:
+            logger.error(f"❌ サポートされていないプロバイダー: {provider}")
+            return None
+        # 分割処理のチャンクも含め、ファイル全体で同時実行数を共有する
+        with self._api_slots:
+            return handler(prompt, sink)
+    
+    def _map_reduce(self, chunks: List[str], sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """🗺️ チャンクごとの議事録を並行生成し、1つの議事録に統合"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        template_parts = self._tmpl_parts
+        max_workers = min(len(chunks), max(1, self.config["llm"].get("max_concurrency", 8)))
+        
+        # 呼び出し元のイベントループの有無に関係なく使えるよう、専用のスレッドプールで並行実行
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="memo-chunk") as executor:
+            partials = list(executor.map(lambda chunk: self._call_api(chunk.join(template_parts)), chunks))
+        
+        if not all(partials):
+            logger.error(f"❌ 部分議事録の生成に失敗しました（{sum(1 for p in partials if not p)}/{len(partials)}）")
+            return None
+        
+        # 部分議事録を統合
+        merged = "\n\n".join(f"【パート{i}】\n{p}" for i, p in enumerate(partials, 1))
+        merge_template = self.config["templates"].get("merge", DEFAULT_MERGE_TEMPLATE)
+        return self._call_api(merge_template.replace("{transcription}", merged), sink)
+    
+    def _openai_body(self, prompt: str) -> Dict[str, Any]:
+        """📦 OpenAI Chat Completions APIのリクエストボディを作成"""
+        return {
+            **self._endpoint[3],
+            "messages": [
+                {"role": "system", "content": "あなたは会議の音声文字起こしから議事録を作成する専門家です。"},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.config["llm"]["temperature"],
+            "max_tokens": self.config["llm"]["max_tokens"]
+        }
+    
+    def _call_openai_api(self, prompt: str, sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """🔄 OpenAI APIを呼び出す"""
+        stream = sink is not None
         api_key = self.config["llm"].get("openai_api_key", "")
         if not api_key:
             logger.error("🔑 OpenAI APIキーが設定されていません。")
             return None
         
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}"
-            }
+            url, stream_url, headers, _ = self._endpoint
+            data = self._openai_body(prompt)
+            if stream:
+                data["stream"] = True
             
-            data = {
-                "model": self.config["llm"]["model"],
-                "messages": [
-                    {"role": "system", "content": "あなたは会議の音声文字起こしから議事録を作成する専門家です。"},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": self.config["llm"]["temperature"],
-                "max_tokens": self.config["llm"]["max_tokens"]
-            }
-            
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
+            self._bucket.acquire()
+            response = self._session.post(
+                stream_url if stream else url,
                 headers=headers,
-                json=data
+                data=_json_dumps(data),
+                stream=stream
             )
             
             if response.status_code == 200:
-                result = response.json()
+                if stream:
+                    return _collect_stream(_openai_stream_deltas(response), sink)
+                result = _json_loads(response.content)
                 return result["choices"][0]["message"]["content"]
             else:
                 logger.error(f"❌ API呼び出しエラー: {response.status_code} - {response.text}")
@@ -168,38 +966,39 @@ class MemoGenerator:
             logger.error(f"⚠️ OpenAI API呼び出し例外: {e}")
             return None
     
-    def _call_anthropic_api(self, prompt: str) -> Optional[str]:
+    def _call_anthropic_api(self, prompt: str, sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """🔄 Anthropic Claude APIを呼び出す"""
+        stream = sink is not None
         api_key = self.config["llm"].get("anthropic_api_key", "")
         if not api_key:
             logger.error("🔑 Anthropic APIキーが設定されていません。")
             return None
         
         try:
-            # Claude Messages API形式で呼び出し
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01"
-            }
-            
+            url, stream_url, headers, body_template = self._endpoint
             data = {
-                "model": self.config["llm"]["model"],
+                **body_template,
                 "messages": [
                     {"role": "user", "content": prompt}
                 ],
                 "temperature": self.config["llm"]["temperature"],
                 "max_tokens": self.config["llm"]["max_tokens"]
             }
+            if stream:
+                data["stream"] = True
             
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
+            self._bucket.acquire()
+            response = self._session.post(
+                stream_url if stream else url,
                 headers=headers,
-                json=data
+                data=_json_dumps(data),
+                stream=stream
             )
             
             if response.status_code == 200:
-                result = response.json()
+                if stream:
+                    return _collect_stream(_anthropic_stream_deltas(response), sink)
+                result = _json_loads(response.content)
                 return result["content"][0]["text"]
             else:
                 logger.error(f"❌ API呼び出しエラー: {response.status_code} - {response.text}")
@@ -209,23 +1008,16 @@ class MemoGenerator:
             logger.error(f"⚠️ Anthropic API呼び出し例外: {e}")
             return None
     
-    def _call_google_api(self, prompt: str) -> Optional[str]:
+    def _call_google_api(self, prompt: str, sink: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """🔄 Google Gemini APIを呼び出す"""
+        stream = sink is not None
         api_key = self.config["llm"].get("google_api_key", "")
         if not api_key:
             logger.error("🔑 Google APIキーが設定されていません。")
             return None
         
         try:
-            # モデル名に基づいてAPIパスを構築
-            model = self.config["llm"]["model"]
-            model_id = model.replace("gemini-", "")
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}:generateContent?key={api_key}"
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
+            url, stream_url, headers, body_template = self._endpoint
             data = {
                 "contents": [
                     {
@@ -234,25 +1026,22 @@ class MemoGenerator:
                     }
                 ],
                 "generationConfig": {
+                    **body_template["generationConfig"],
                     "temperature": self.config["llm"]["temperature"],
-                    "maxOutputTokens": self.config["llm"]["max_tokens"],
-                    "topP": 0.95,
-                    "topK": 40
+                    "maxOutputTokens": self.config["llm"]["max_tokens"]
                 }
             }
             
-            response = requests.post(url, headers=headers, json=data)
+            self._bucket.acquire()
+            response = self._session.post(stream_url if stream else url, headers=headers, data=_json_dumps(data), stream=stream)
             
             if response.status_code == 200:
-                result = response.json()
-                if "candidates" in result and len(result["candidates"]) > 0:
-                    if "content" in result["candidates"][0]:
-                        if "parts" in result["candidates"][0]["content"]:
-                            text_parts = []
-                            for part in result["candidates"][0]["content"]["parts"]:
-                                if "text" in part:
-                                    text_parts.append(part["text"])
-                            return "".join(text_parts)
+                if stream:
+                    return _collect_stream(_google_stream_deltas(response), sink)
+                result = _json_loads(response.content)
+                text = _google_text(result)
+                if text is not None:
+                    return text
                 
                 logger.error(f"❌ Google API応答の解析に失敗しました: {result}")
                 return None
@@ -264,30 +1053,51 @@ class MemoGenerator:
             logger.error(f"⚠️ Google API呼び出し例外: {e}")
             return None
     
+    def validate(self) -> List[str]:
+        """🩺 API呼び出し前に設定を検証し、問題点の一覧を返す（問題なければ空リスト）"""
+        errors = []
+        llm = self.config["llm"]
+        
+        provider = llm.get("provider")
+        key_field = PROVIDER_KEY_FIELDS.get(provider)
+        if key_field is None:
+            errors.append(f"サポートされていないプロバイダー: {provider}")
+        elif not llm.get(key_field):
+            errors.append(f"{provider}のAPIキーが設定されていません（{key_field}）")
+        
+        if "{transcription}" not in self.config.get("templates", {}).get("default", ""):
+            errors.append("テンプレートに{transcription}が含まれていません")
+        
+        temperature = llm.get("temperature")
+        if not isinstance(temperature, (int, float)) or not 0.0 <= temperature <= 1.0:
+            errors.append(f"temperatureは0.0〜1.0で指定してください: {temperature}")
+        
+        return errors
+    
     def set_provider(self, provider: str):
         """🔧 LLMプロバイダーを設定"""
-        if provider not in self.config.get("providers", {}):
+        if provider not in self._provider_models:
             logger.warning(f"⚠️ 未知のプロバイダー: {provider}")
         self.config["llm"]["provider"] = provider
+        self._prepare_provider()
     
     def set_model(self, model: str):
         """🔧 LLMモデルを設定"""
         provider = self.config["llm"]["provider"]
-        models = self.config.get("providers", {}).get(provider, [])
+        models = self._provider_models.get(provider)
         if models and model not in models:
             logger.warning(f"⚠️ プロバイダー '{provider}' では未知のモデル: {model}")
         self.config["llm"]["model"] = model
+        self._prepare_provider()
     
     def set_api_key(self, api_key: str, provider_type: Optional[str] = None):
         """🔑 APIキーを設定"""
         provider = provider_type if provider_type else self.config["llm"]["provider"]
         
-        if provider == "openai":
-            self.config["llm"]["openai_api_key"] = api_key
-        elif provider == "anthropic":
-            self.config["llm"]["anthropic_api_key"] = api_key
-        elif provider == "google":
-            self.config["llm"]["google_api_key"] = api_key
+        key_field = PROVIDER_KEY_FIELDS.get(provider)
+        if key_field:
+            self.config["llm"][key_field] = api_key
+            self._prepare_provider()
     
     def set_temperature(self, temperature: float):
         """🌡️ temperatureパラメータを設定"""
@@ -297,17 +1107,41 @@ class MemoGenerator:
         """📏 max_tokensパラメータを設定"""
         self.config["llm"]["max_tokens"] = max(1, max_tokens)
     
+    def set_cache(self, enabled: bool):
+        """💾 応答キャッシュの有効/無効を設定"""
+        self.config["llm"]["cache"] = enabled
+        self._cache = self._create_cache()
+    
+    def cache_stats(self) -> Optional[Tuple[int, int]]:
+        """📊 キャッシュのヒット数とミス数（キャッシュ無効時はNone）"""
+        if self._cache is None:
+            return None
+        return self._cache.hits, self._cache.misses
+    
     def set_template(self, template_text: str):
         """📝 テンプレートを設定"""
         self.config["templates"]["default"] = template_text
+        self._prepare_template()
+
+
+# 🔧 コマンドライン引数と設定メソッドの対応表
+_ARG_TO_SETTER = (
+    ("provider", MemoGenerator.set_provider),
+    ("model", MemoGenerator.set_model),
+    ("openai_api_key", lambda generator, key: generator.set_api_key(key, "openai")),
+    ("anthropic_api_key", lambda generator, key: generator.set_api_key(key, "anthropic")),
+    ("google_api_key", lambda generator, key: generator.set_api_key(key, "google")),
+    ("temperature", MemoGenerator.set_temperature),
+    ("max_tokens", MemoGenerator.set_max_tokens)
+)
 
 
 def parse_arguments():
     """🔍 コマンドライン引数のパース"""
     parser = argparse.ArgumentParser(description="🤖 AI Memo Generator - 文字起こしから議事録を生成")
     
-    parser.add_argument("--input", "-i", required=True, help="文字起こしテキストファイルのパス")
-    parser.add_argument("--output", "-o", help="出力ファイルパス（デフォルト：input_memo.txt）")
+    parser.add_argument("--input", "-i", required=True, nargs="+", help="文字起こしテキストファイルのパス（複数指定時は並行処理）")
+    parser.add_argument("--output", "-o", help="出力ファイルパス（デフォルト：input_memo.txt、入力が1ファイルの場合のみ）")
     parser.add_argument("--config", "-c", default="config.json", help="設定ファイルパス")
     parser.add_argument("--provider", "-p", help="LLMプロバイダー（openai/anthropic/google）")
     parser.add_argument("--model", "-m", help="使用するモデル名")
@@ -316,6 +1150,11 @@ def parse_arguments():
     parser.add_argument("--google-api-key", "-gk", help="Google APIキー")
     parser.add_argument("--temperature", "-t", type=float, help="Temperature値（0.0〜1.0）")
     parser.add_argument("--max-tokens", "-mt", type=int, help="最大トークン数")
+    parser.add_argument("--batch", action="store_true", help="OpenAI Batch APIでまとめて処理（低コスト・完了まで最大24時間）")
+    parser.add_argument("--batch-poll-interval", type=float, default=30.0, help="バッチ処理の状態確認間隔（秒）")
+    parser.add_argument("--no-cache", action="store_true", help="応答キャッシュを使用しない")
+    parser.add_argument("--stream", action="store_true", help="生成中の議事録を受信しながら表示（入力が1ファイルの場合のみ）")
+    parser.add_argument("--pipe", action="store_true", help="生成中の議事録を1文ずつ標準出力へ流す（ファイルには保存しない、入力が1ファイルの場合のみ）")
     
     return parser.parse_args()
 
@@ -324,45 +1163,72 @@ def main():
     """🚀 メインエントリーポイント"""
     # 引数解析
     args = parse_arguments()
+    configure_logging()
     
     # 初期設定
     generator = MemoGenerator(config_path=args.config)
     
     # コマンドライン引数から設定を上書き
-    if args.provider:
-        generator.set_provider(args.provider)
-    
-    if args.model:
-        generator.set_model(args.model)
-    
-    if args.openai_api_key:
-        generator.set_api_key(args.openai_api_key, "openai")
-    
-    if args.anthropic_api_key:
-        generator.set_api_key(args.anthropic_api_key, "anthropic")
+    for attr, setter in _ARG_TO_SETTER:
+        value = getattr(args, attr, None)
+        if value is not None:
+            setter(generator, value)
     
-    if args.google_api_key:
-        generator.set_api_key(args.google_api_key, "google")
+    if args.no_cache:
+        generator.set_cache(False)
     
-    if args.temperature is not None:
-        generator.set_temperature(args.temperature)
-    
-    if args.max_tokens is not None:
-        generator.set_max_tokens(args.max_tokens)
+    # 入力ファイルを読む前に設定を検証
+    errors = generator.validate()
+    if errors:
+        for error in errors:
+            logger.error(f"❌ 設定エラー: {error}")
+        return 1
     
     # 入力ファイルが存在するか確認
-    if not os.path.isfile(args.input):
-        logger.error(f"❌ 入力ファイルが存在しません: {args.input}")
+    for input_file in args.input:
+        if not os.path.isfile(input_file):
+            logger.error(f"❌ 入力ファイルが存在しません: {input_file}")
+            return 1
+    
+    if (len(args.input) > 1 or args.batch) and (args.output or args.stream or args.pipe):
+        logger.error("❌ 複数の入力ファイルまたは--batchを指定した場合、--output/--stream/--pipeは使用できません")
         return 1
     
     # 議事録生成
-    result = generator.generate_memo_from_file(args.input, args.output)
+    if args.pipe:
+        # 文単位で標準出力へ流し、後段（読み上げ等）がすぐに処理を始められるようにする
+        try:
+            transcription = _read_text(args.input[0])
+        except Exception as e:
+            logger.error(f"⚠️ 入力ファイルの読み込みエラー: {e}")
+            return 1
+        outcome: Dict[str, Any] = {}
+        for sentence in _iter_sentences(generator.iter_memo(transcription, outcome)):
+            sys.stdout.write(sentence + "\n")
+            sys.stdout.flush()
+        # 途中まで出力できても、生成自体が失敗していれば失敗として扱う
+        results = [outcome["memo"]]
+    elif args.batch:
+        results = generator.generate_memos_batch(args.input, args.batch_poll_interval)
+    elif len(args.input) == 1:
+        results = [generator.generate_memo_from_file(args.input[0], args.output, stream=args.stream)]
+        if args.stream and results[0]:
+            print()
+    else:
+        results = generator.generate_memos_from_files(args.input)
+    
+    stats = generator.cache_stats()
+    if stats is not None:
+        logger.info(f"💾 キャッシュ: ヒット {stats[0]} / ミス {stats[1]}")
     
-    if result:
-        print("✅ 議事録の生成が完了しました。")
+    # --pipeでは標準出力を議事録本文のみにするため、結果メッセージは標準エラーへ
+    status_out = sys.stderr if args.pipe else sys.stdout
+    if all(results):
+        print("✅ 議事録の生成が完了しました。", file=status_out)
         return 0
     else:
-        print("❌ 議事録の生成に失敗しました。詳細はログを確認してください。")
+        failed = sum(1 for r in results if not r)
+        print(f"❌ 議事録の生成に失敗しました（{failed}/{len(results)}ファイル）。詳細はログを確認してください。", file=status_out)
         return 1
 
 